@@ -12,6 +12,8 @@ import os
 
 # Installed
 import flask
+import flask.json.provider
+import orjson
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
 from logging.config import dictConfig
@@ -82,6 +84,28 @@ class FilterMaintenanceExc(logging.Filter):
         return record.exc_info is None or record.exc_info[0] != MaintenanceOngoingException
 
 
+class OrjsonProvider(flask.json.provider.DefaultJSONProvider):
+    """JSON provider serializing responses with orjson instead of the stdlib json module.
+
+    Types not natively handled by orjson (and datetimes, to keep the HTTP date format)
+    are passed on to the default Flask serializer.
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON, falling back to the default provider for custom options."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def response(self, *args, **kwargs):
+        """Serialize data as JSON and wrap it in a response with the json mimetype."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(f"{self.dumps(obj)}\n", mimetype=self.mimetype)
+
+
 def setup_logging(app):
     """Setup loggers"""
 
@@ -188,6 +212,9 @@ def create_app(testing=False, database_uri=None):
         # Initiate app object
         app = flask.Flask(__name__, instance_relative_config=False)
 
+        # Serialize json responses with orjson
+        app.json = OrjsonProvider(app)
+
         # All variables in the env that start with FLASK_* will be loaded into the app config
         # 'FLASK_' will be dropped, e.g. FLASK_TESTVAR will be loaded as TESTVAR
         app.config.from_prefixed_env()
@@ -206,6 +233,8 @@ def create_app(testing=False, database_uri=None):
         if testing:
             # Simplifies testing as we don't test the session protection anyway
             login_manager.session_protection = "basic"
+            # Send emails within the request so that they can be checked
+            app.config["MAIL_SEND_IN_BACKGROUND"] = False
 
         @app.before_request
         def prepare():
@@ -143,7 +143,7 @@ class NewFile(flask_restful.Resource):
             # Get version row
             current_file_version = models.Version.query.filter(
                 sqlalchemy.and_(
-                    models.Version.active_file == sqlalchemy.func.binary(existing_file.id),
+                    models.Version.active_file == existing_file.id,
                     models.Version.time_deleted.is_(None),
                 )
             ).all()
@@ -228,7 +228,7 @@ class MatchFiles(flask_restful.Resource):
             try:
                 matching_files = (
                     models.File.query.filter(models.File.name.in_(files))
-                    .filter(models.File.project_id == sqlalchemy.func.binary(project.id))
+                    .filter(models.File.project_id == project.id)
                     .all()
                 )
             except (sqlalchemy.exc.SQLAlchemyError, sqlalchemy.exc.OperationalError) as err:
@@ -261,7 +261,7 @@ class MatchFiles(flask_restful.Resource):
         try:
             matching_files = (
                 models.File.query.filter(models.File.name.in_(flask.request.get_json(silent=True)))
-                .filter(models.File.project_id == sqlalchemy.func.binary(project.id))
+                .filter(models.File.project_id == project.id)
                 .all()
             )
         except (sqlalchemy.exc.SQLAlchemyError, sqlalchemy.exc.OperationalError) as err:
@@ -372,7 +372,7 @@ class ListFiles(flask_restful.Resource):
                 )
                 .filter(
                     sqlalchemy.and_(
-                        models.File.project_id == sqlalchemy.func.binary(project.id),
+                        models.File.project_id == project.id,
                         models.File.subpath.like(f"{folder_name}%"),
                     )
                 )
@@ -404,9 +404,7 @@ class ListFiles(flask_restful.Resource):
             folder = folder[:-1]
         try:
             # All files in project
-            files = models.File.query.filter(
-                models.File.project_id == sqlalchemy.func.binary(project.id)
-            )
+            files = models.File.query.filter(models.File.project_id == project.id)
 
             # File names in root
             distinct_files = (
@@ -581,7 +579,7 @@ class RemoveFile(flask_restful.Resource):
         # Get matching files in project
         file = models.File.query.filter(
             models.File.name == sqlalchemy.func.binary(filename),
-            models.File.project_id == sqlalchemy.func.binary(project.id),
+            models.File.project_id == project.id,
         ).one_or_none()
 
         if not file:
@@ -592,7 +590,7 @@ class RemoveFile(flask_restful.Resource):
         # get current version
         current_file_version = models.Version.query.filter(
             sqlalchemy.and_(
-                models.Version.active_file == sqlalchemy.func.binary(file.id),
+                models.Version.active_file == file.id,
                 models.Version.time_deleted.is_(None),
             )
         ).first()
@@ -749,9 +747,7 @@ class RemoveDir(flask_restful.Resource):
         try:
             # File names in root
             files = (
-                models.File.query.filter(
-                    models.File.project_id == sqlalchemy.func.binary(project.id)
-                )
+                models.File.query.filter(models.File.project_id == project.id)
                 .filter(
                     sqlalchemy.or_(
                         models.File.subpath == sqlalchemy.func.binary(folder),
@@ -779,7 +775,7 @@ class RemoveDir(flask_restful.Resource):
             # get current version
             current_file_version = models.Version.query.filter(
                 sqlalchemy.and_(
-                    models.Version.active_file == sqlalchemy.func.binary(entry.id),
+                    models.Version.active_file == entry.id,
                     models.Version.time_deleted.is_(None),
                 )
             ).first()
@@ -901,7 +897,7 @@ class UpdateFile(flask_restful.Resource):
             flask.current_app.logger.debug(f"File name: {file_name}")
             file = models.File.query.filter(
                 sqlalchemy.and_(
-                    models.File.project_id == sqlalchemy.func.binary(project.id),
+                    models.File.project_id == project.id,
                     models.File.name == sqlalchemy.func.binary(file_name),
                 )
             ).first()
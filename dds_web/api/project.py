@@ -197,10 +197,14 @@ class ProjectStatus(flask_restful.Resource):
 
             # Mail users once project is made available
             if new_status == "Available" and send_email:
-                for user in project.researchusers:
-                    AddUser.compose_and_send_email_to_user(
-                        userobj=user.researchuser, mail_type="project_release", project=project
+                # Send all release emails over one SMTP connection
+                dds_web.utils.send_email_in_background(
+                    *AddUser.compose_emails_to_users(
+                        userobjs=[user.researchuser for user in project.researchusers],
+                        mail_type="project_release",
+                        project=project,
                     )
+                )
 
             return_message = f"{project.public_id} updated to status {new_status}" + (
                 " (aborted)" if new_status == "Archived" and is_aborted else ""
@@ -720,8 +724,6 @@ class UserProjects(flask_restful.Resource):
 
     @staticmethod
     def project_usage(project):
-        # Calculate approximate cost per gbhour: kr per gb per month / (days * hours)
-        cost_gbhour = 0.09 / (30 * 24)
         bhours = 0.0
         cost = 0.0
 
@@ -736,7 +738,7 @@ class UserProjects(flask_restful.Resource):
             )
 
         # Save file cost to project info and increase total unit cost
-        cost = (bhours / 1e9) * cost_gbhour
+        cost = (bhours / 1e9) * dds_web.utils.COST_PER_GBHOUR
 
         return bhours, cost
 
@@ -998,7 +1000,7 @@ class ProjectAccess(flask_restful.Resource):
         if "email" not in json_input:
             raise DDSArgumentError(message="User email missing.")
 
-        user = user_schemas.UserSchema().load({"email": json_input.pop("email")})
+        user = user_schemas.UserSchema().load({"email": json_input.get("email")})
 
         if not user:
             raise NoSuchUserError()
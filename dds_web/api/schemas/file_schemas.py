@@ -110,7 +110,7 @@ class NewFileSchema(project_schemas.ProjectRequiredSchema):
             models.File.query.filter(
                 sqlalchemy.and_(
                     models.File.name == sqlalchemy.func.binary(data.get("name")),
-                    models.File.project_id == sqlalchemy.func.binary(project.id),
+                    models.File.project_id == project.id,
                 )
             )
             .with_entities(models.File.id)
@@ -216,9 +216,7 @@ class ProjectContentSchema(ProjectRequiredSchema):
 
     def find_contents(self, project, contents):
         # All contents
-        all_contents_query = models.File.query.filter(
-            models.File.project_id == sqlalchemy.func.binary(project.id)
-        )
+        all_contents_query = models.File.query.filter(models.File.project_id == project.id)
 
         # Get all files
         files = all_contents_query.filter(models.File.name.in_(contents)).all()
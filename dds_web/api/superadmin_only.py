@@ -5,7 +5,6 @@
 ####################################################################################################
 
 # Standard library
-import os
 import typing
 
 # Installed
@@ -175,8 +174,8 @@ class SendMOTD(flask_restful.Resource):
         # Create email content
         # put motd_obj.message etc in there etc
         subject: str = "Important Information: Data Delivery System"
-        body: str = flask.render_template(f"mail/motd.txt", motd=motd_obj.message)
-        html = flask.render_template(f"mail/motd.html", motd=motd_obj.message)
+        body: str = utils.render_email_template("mail/motd.txt", motd=motd_obj.message)
+        html = utils.render_email_template("mail/motd.html", motd=motd_obj.message)
 
         # Setup email connection
         with mail.connect() as conn:
@@ -194,10 +193,7 @@ class SendMOTD(flask_restful.Resource):
                 msg.attach(
                     "scilifelab_logo.png",
                     "image/png",
-                    open(
-                        os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"),
-                        "rb",
-                    ).read(),
+                    utils.read_email_logo(flask.current_app.static_folder),
                     "inline",
                     headers=[
                         ["Content-ID", "<Logo>"],
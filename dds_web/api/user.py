@@ -5,9 +5,6 @@
 ####################################################################################################
 
 # Standard library
-import os
-import smtplib
-import time
 import datetime
 
 # Installed
@@ -15,17 +12,15 @@ import flask
 import flask_restful
 from flask_restful import inputs
 import flask_mail
-import itsdangerous
 import structlog
 import sqlalchemy
 import http
 
 
 # Own modules
-from dds_web import auth, mail, db, basic_auth, limiter
+from dds_web import auth, db, basic_auth, limiter
 from dds_web.database import models
 import dds_web.utils
-import dds_web.forms
 import dds_web.errors as ddserr
 from dds_web.api.schemas import project_schemas, user_schemas, token_schemas
 from dds_web.api.dds_decorators import (
@@ -37,6 +32,7 @@ from dds_web.api.dds_decorators import (
 from dds_web.security.project_user_keys import (
     generate_invite_key_pair,
     share_project_private_key,
+    share_project_private_keys,
 )
 from dds_web.security.tokens import encrypted_jwt_token, update_token_with_mfa
 from dds_web.security.auth import get_user_roles_common
@@ -45,6 +41,16 @@ from dds_web.security.auth import get_user_roles_common
 # initiate bound logger
 action_logger = structlog.getLogger("actions")
 
+# marshmallow schemas hold no per-request state, so one instance can be reused
+user_schema = user_schemas.UserSchema()
+
+# Roles which users with a specific role are not allowed to invite. Researchers cannot invite.
+FORBIDDEN_INVITE_ROLES = {
+    "Unit Admin": {"Super Admin"},
+    "Unit Personnel": {"Super Admin", "Unit Admin"},
+    "Project Owner": {"Super Admin", "Unit Admin", "Unit Personnel"},
+}
+
 
 ####################################################################################################
 # ENDPOINTS ############################################################################ ENDPOINTS #
@@ -80,10 +86,12 @@ class AddUser(flask_restful.Resource):
         # Notify the users about project additions? Invites are still being sent out.
         send_email = json_info.get("send_email", True)
 
-        # Check if email is registered to a user
+        # Check if email is registered to a user, and otherwise if it has an unanswered invite
         try:
-            existing_user = user_schemas.UserSchema().load({"email": email})
-            unanswered_invite = user_schemas.UnansweredInvite().load({"email": email})
+            existing_user = user_schema.load({"email": email})
+            unanswered_invite = (
+                None if existing_user else user_schemas.UnansweredInvite().load({"email": email})
+            )
         except (sqlalchemy.exc.SQLAlchemyError, sqlalchemy.exc.OperationalError) as err:
             db.session.rollback()
             raise ddserr.DatabaseError(
@@ -122,7 +130,8 @@ class AddUser(flask_restful.Resource):
     def invite_user(email, new_user_role, project=None, unit=None):
         """Invite a new user"""
 
-        current_user_role = get_user_roles_common(user=auth.current_user())
+        current_user = auth.current_user()
+        current_user_role = get_user_roles_common(user=current_user)
 
         if not project:
             if current_user_role == "Project Owner":
@@ -145,29 +154,9 @@ class AddUser(flask_restful.Resource):
                     "not invite users to specific projects."
                 ),
             }
-        elif current_user_role == "Unit Admin" and new_user_role == "Super Admin":
-            return {
-                "status": ddserr.AccessDeniedError.code.value,
-                "message": ddserr.AccessDeniedError.description,
-            }
-        elif current_user_role == "Unit Personnel" and new_user_role in [
-            "Super Admin",
-            "Unit Admin",
-        ]:
-            return {
-                "status": ddserr.AccessDeniedError.code.value,
-                "message": ddserr.AccessDeniedError.description,
-            }
-        elif current_user_role == "Project Owner" and new_user_role in [
-            "Super Admin",
-            "Unit Admin",
-            "Unit Personnel",
-        ]:
-            return {
-                "status": ddserr.AccessDeniedError.code.value,
-                "message": ddserr.AccessDeniedError.description,
-            }
-        elif current_user_role == "Researcher":
+        elif current_user_role == "Researcher" or new_user_role in FORBIDDEN_INVITE_ROLES.get(
+            current_user_role, ()
+        ):
             return {
                 "status": ddserr.AccessDeniedError.code.value,
                 "message": ddserr.AccessDeniedError.description,
@@ -207,7 +196,7 @@ class AddUser(flask_restful.Resource):
         # Append invite to unit if applicable
         if new_invite.role in ["Unit Admin", "Unit Personnel"]:
             # TODO Change / move this later. This is just so that we can add an initial Unit Admin.
-            if auth.current_user().role == "Super Admin":
+            if current_user.role == "Super Admin":
                 if unit:
                     unit_row = models.Unit.query.filter_by(public_id=unit).one_or_none()
                     if not unit_row:
@@ -220,25 +209,27 @@ class AddUser(flask_restful.Resource):
                         message="You need to specify a unit to invite a Unit Personnel or Unit Admin."
                     )
 
-            if "Unit" in auth.current_user().role:
+            if "Unit" in current_user.role:
+                # Link the invite to the unit without loading all of the unit's invites
+                unit = current_user.unit
+                new_invite.unit = unit
+                db.session.add(new_invite)
+
                 # Give new unit user access to all projects of the unit
-                auth.current_user().unit.invites.append(new_invite)
-                if auth.current_user().unit.projects:
-                    for unit_project in auth.current_user().unit.projects:
-                        if unit_project.is_active:
-                            try:
-                                share_project_private_key(
-                                    from_user=auth.current_user(),
-                                    to_another=new_invite,
-                                    from_user_token=dds_web.security.auth.obtain_current_encrypted_token(),
-                                    project=unit_project,
-                                )
-                            except ddserr.KeyNotFoundError as keyerr:
-                                projects_not_shared[unit_project.public_id] = (
-                                    "You do not have access to the project(s)"
-                                )
-                            else:
-                                goahead = True
+                if unit.projects:
+                    active_projects = [p for p in unit.projects if p.is_active]
+                    projects_without_keys = share_project_private_keys(
+                        from_user=current_user,
+                        to_another=new_invite,
+                        from_user_token=dds_web.security.auth.obtain_current_encrypted_token(),
+                        projects=active_projects,
+                    )
+                    for unit_project in projects_without_keys:
+                        projects_not_shared[unit_project.public_id] = (
+                            "You do not have access to the project(s)"
+                        )
+                    if len(projects_without_keys) < len(active_projects):
+                        goahead = True
                 else:
                     goahead = True
 
@@ -252,7 +243,7 @@ class AddUser(flask_restful.Resource):
             if project:
                 try:
                     share_project_private_key(
-                        from_user=auth.current_user(),
+                        from_user=current_user,
                         to_another=new_invite,
                         project=project,
                         from_user_token=dds_web.security.auth.obtain_current_encrypted_token(),
@@ -351,7 +342,8 @@ class AddUser(flask_restful.Resource):
 
         if not ownership_change:
             if isinstance(whom, models.ResearchUser):
-                project.researchusers.append(
+                # Add the row directly to avoid loading all of the project's users
+                db.session.add(
                     models.ProjectUsers(
                         project_id=project.id,
                         user_id=whom.username,
@@ -401,7 +393,10 @@ class AddUser(flask_restful.Resource):
             AddUser.compose_and_send_email_to_user(whom, "project_release", project=project)
 
         flask.current_app.logger.debug(
-            f"{str(whom)} was given access to the {str(project)} as a {'Project Owner' if is_owner else 'Researcher'}."
+            "%s was given access to the %s as a %s.",
+            whom,
+            project,
+            "Project Owner" if is_owner else "Researcher",
         )
 
         return {
@@ -416,11 +411,17 @@ class AddUser(flask_restful.Resource):
     @logging_bind_request
     def compose_and_send_email_to_user(userobj, mail_type, link=None, project=None):
         """Compose and send email"""
-        if hasattr(userobj, "emails"):
-            recipients = [x.email for x in userobj.emails]
-        else:
-            # userobj likely an invite
-            recipients = [userobj.email]
+        dds_web.utils.send_email_in_background(
+            *AddUser.compose_emails_to_users(
+                userobjs=[userobj], mail_type=mail_type, link=link, project=project
+            )
+        )
+
+    @staticmethod
+    def compose_emails_to_users(userobjs, mail_type, link=None, project=None):
+        """Compose one email per user or invite, rendering the templates only once"""
+        if not userobjs:
+            return []
 
         unit_email = None
         project_id = None
@@ -428,13 +429,14 @@ class AddUser(flask_restful.Resource):
         deadline = None
 
         # Don't display unit admins or personnels name
-        if auth.current_user().role in ["Unit Admin", "Unit Personnel"]:
-            unit = auth.current_user().unit
+        current_user = auth.current_user()
+        if current_user.role in ["Unit Admin", "Unit Personnel"]:
+            unit = current_user.unit
             unit_email = unit.contact_email
             displayed_sender = unit.external_display_name
         # Display name if Super admin or Project owners
         else:
-            displayed_sender = auth.current_user().name
+            displayed_sender = current_user.name
 
         # Fill in email subject with sentence subject
         if mail_type == "invite":
@@ -449,44 +451,48 @@ class AddUser(flask_restful.Resource):
         else:
             raise ddserr.DDSArgumentError(message="Invalid mail type!")
 
-        msg = flask_mail.Message(
-            subject,
-            recipients=recipients,
-        )
+        # The content is the same for all recipients
+        context = {
+            "link": link,
+            "displayed_sender": displayed_sender,
+            "unit_email": unit_email,
+            "project_id": project_id,
+            "project_title": project_title,
+            "deadline": deadline,
+        }
+        body = dds_web.utils.render_email_template(f"mail/{mail_type}.txt", **context)
+        html = dds_web.utils.render_email_template(f"mail/{mail_type}.html", **context)
+        logo = dds_web.utils.read_email_logo(flask.current_app.static_folder)
+
+        msgs = []
+        for userobj in userobjs:
+            if hasattr(userobj, "emails"):
+                recipients = [x.email for x in userobj.emails]
+            else:
+                # userobj likely an invite
+                recipients = [userobj.email]
 
-        # Need to attach the image to be able to use it
-        msg.attach(
-            "scilifelab_logo.png",
-            "image/png",
-            open(
-                os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb"
-            ).read(),
-            "inline",
-            headers=[
-                ["Content-ID", "<Logo>"],
-            ],
-        )
+            msg = flask_mail.Message(
+                subject,
+                recipients=recipients,
+            )
 
-        msg.body = flask.render_template(
-            f"mail/{mail_type}.txt",
-            link=link,
-            displayed_sender=displayed_sender,
-            unit_email=unit_email,
-            project_id=project_id,
-            project_title=project_title,
-            deadline=deadline,
-        )
-        msg.html = flask.render_template(
-            f"mail/{mail_type}.html",
-            link=link,
-            displayed_sender=displayed_sender,
-            unit_email=unit_email,
-            project_id=project_id,
-            project_title=project_title,
-            deadline=deadline,
-        )
+            # Need to attach the image to be able to use it
+            msg.attach(
+                "scilifelab_logo.png",
+                "image/png",
+                logo,
+                "inline",
+                headers=[
+                    ["Content-ID", "<Logo>"],
+                ],
+            )
+
+            msg.body = body
+            msg.html = html
+            msgs.append(msg)
 
-        dds_web.utils.send_email_with_retry(msg)
+        return msgs
 
 
 class RetrieveUserInfo(flask_restful.Resource):
@@ -521,10 +527,6 @@ class DeleteUserSelf(flask_restful.Resource):
 
         username = current_user.username
 
-        proj_ids = None
-        if current_user.role != "Super Admin":
-            proj_ids = [proj.public_id for proj in current_user.projects]
-
         if current_user.role == "Unit Admin":
             num_admins = models.UnitUser.query.filter_by(
                 unit_id=current_user.unit.id, is_admin=True
@@ -539,7 +541,7 @@ class DeleteUserSelf(flask_restful.Resource):
                 )
 
         # Create URL safe token for invitation link
-        s = itsdangerous.URLSafeTimedSerializer(flask.current_app.config["SECRET_KEY"])
+        s = dds_web.utils.url_safe_serializer(flask.current_app.config["SECRET_KEY"])
         token = s.dumps(email_str, salt="email-delete")
 
         # Create deletion request in database unless it already exists
@@ -575,6 +577,16 @@ class DeleteUserSelf(flask_restful.Resource):
                 ),
             ) from sqlerr
 
+        # Get the public ids of the user's projects, without loading the projects themselves
+        if "Unit" in current_user.role:
+            user_projects = models.Project.unit_id == current_user.unit_id
+        else:
+            user_projects = models.Project.researchusers.any(user_id=username)
+        proj_ids = [
+            public_id
+            for (public_id,) in db.session.query(models.Project.public_id).filter(user_projects)
+        ]
+
         # Create link for deletion request email
         link = flask.url_for("auth_blueprint.confirm_self_deletion", token=token, _external=True)
         subject = f"Confirm deletion of your user account {username} in the SciLifeLab Data Delivery System"
@@ -588,33 +600,33 @@ class DeleteUserSelf(flask_restful.Resource):
         msg.attach(
             "scilifelab_logo.png",
             "image/png",
-            open(
-                os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb"
-            ).read(),
+            dds_web.utils.read_email_logo(flask.current_app.static_folder),
             "inline",
             headers=[
                 ["Content-ID", "<Logo>"],
             ],
         )
 
-        msg.body = flask.render_template(
+        msg.body = dds_web.utils.render_email_template(
             "mail/deletion_request.txt",
             link=link,
             sender_name=current_user.name,
             projects=proj_ids,
         )
-        msg.html = flask.render_template(
+        msg.html = dds_web.utils.render_email_template(
             "mail/deletion_request.html",
             link=link,
             sender_name=current_user.name,
             projects=proj_ids,
         )
 
-        mail.send(msg)
+        dds_web.utils.send_email_in_background(msg)
 
         flask.current_app.logger.info(
-            f"The user account {username} / {email_str} ({current_user.role}) "
-            "has requested self-deletion."
+            "The user account %s / %s (%s) has requested self-deletion.",
+            username,
+            email_str,
+            current_user.role,
         )
 
         return {
@@ -643,7 +655,7 @@ class UserActivation(flask_restful.Resource):
             raise ddserr.DDSArgumentError(message="User email missing.")
 
         try:
-            user = user_schemas.UserSchema().load({"email": json_input.pop("email")})
+            user = user_schema.load({"email": json_input.get("email")})
         except sqlalchemy.exc.OperationalError as err:
             raise ddserr.DatabaseError(message=str(err), alt_message="Unexpected database error.")
 
@@ -766,7 +778,7 @@ class DeleteUser(flask_restful.Resource):
                 }
 
             try:
-                user = user_schemas.UserSchema().load({"email": email})
+                user = user_schema.load({"email": email})
             except sqlalchemy.exc.OperationalError as err:
                 raise ddserr.DatabaseError(
                     message=str(err), alt_message="Unexpected database error."
@@ -826,16 +838,16 @@ class DeleteUser(flask_restful.Resource):
         """Implementation of old get method. Should be removed when api/v1 is removed."""
 
         json_info = flask.request.get_json(silent=True)
-        if json_info:
-            is_invite = json_info.pop("is_invite", False)
-            if is_invite:
-                email = self.delete_invite(email=json_info.get("email"))
-                return {
-                    "message": ("The invite connected to email " f"'{email}' has been deleted.")
-                }
+        if not json_info:
+            raise ddserr.MissingJsonError(message="Required data missing from request!")
+
+        is_invite = json_info.get("is_invite", False)
+        if is_invite:
+            email = self.delete_invite(email=json_info.get("email"))
+            return {"message": ("The invite connected to email " f"'{email}' has been deleted.")}
 
         try:
-            user = user_schemas.UserSchema().load(json_info)
+            user = user_schema.load(json_info)
         except sqlalchemy.exc.OperationalError as err:
             raise ddserr.DatabaseError(message=str(err), alt_message="Unexpected database error.")
 
@@ -957,7 +969,7 @@ class RemoveUserAssociation(flask_restful.Resource):
 
         # Check if the user exists or has a pending invite
         try:
-            existing_user = user_schemas.UserSchema().load({"email": user_email})
+            existing_user = user_schema.load({"email": user_email})
             unanswered_invite = user_schemas.UnansweredInvite().load({"email": user_email})
         except sqlalchemy.exc.OperationalError as err:
             raise ddserr.DatabaseError(message=str(err), alt_message="Unexpected database error.")
@@ -1009,26 +1021,22 @@ class RemoveUserAssociation(flask_restful.Resource):
             if auth.current_user().username == existing_user.username:
                 raise ddserr.AccessDeniedError(message="You cannot revoke your own access.")
 
-            # Search the user in the project, when found delete from the database all references to them
-            user_in_project = False
-            for (
-                user_association
-            ) in project.researchusers:  # TODO Possible optimization -> comprehesion list
-                if user_association.user_id == existing_user.username:
-                    user_in_project = True
-                    db.session.delete(user_association)
-                    project_user_key = models.ProjectUserKeys.query.filter_by(
-                        project_id=project.id, user_id=existing_user.username
-                    ).first()
-                    if project_user_key:
-                        db.session.delete(project_user_key)
-                    break
+            # Delete the user's association with the project - the number of deleted rows
+            # tells whether or not the user was in the project
+            user_in_project = models.ProjectUsers.query.filter_by(
+                project_id=project.id, user_id=existing_user.username
+            ).delete(synchronize_session=False)
 
             if not user_in_project:
                 raise ddserr.NoSuchUserError(
                     f"The user with email '{user_email}' does not have access to the specified project. "
                     "Cannot remove non-existent project access."
                 )
+
+            # Delete all other references to the user in the project
+            models.ProjectUserKeys.query.filter_by(
+                project_id=project.id, user_id=existing_user.username
+            ).delete(synchronize_session=False)
             msg = f"User with email {user_email} no longer associated with {project.public_id}."
 
         try:
@@ -1144,25 +1152,17 @@ class RequestTOTPActivation(flask_restful.Resource):
         msg.attach(
             "scilifelab_logo.png",
             "image/png",
-            open(
-                os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb"
-            ).read(),
+            dds_web.utils.read_email_logo(flask.current_app.static_folder),
             "inline",
             headers=[
                 ["Content-ID", "<Logo>"],
             ],
         )
 
-        msg.body = flask.render_template(
-            f"mail/request_activate_totp.txt",
-            link=link,
-        )
-        msg.html = flask.render_template(
-            f"mail/request_activate_totp.html",
-            link=link,
-        )
+        msg.body = dds_web.utils.render_email_template("mail/request_activate_totp.txt", link=link)
+        msg.html = dds_web.utils.render_email_template("mail/request_activate_totp.html", link=link)
 
-        dds_web.utils.send_email_with_retry(msg)
+        dds_web.utils.send_email_in_background(msg)
         return {
             "message": "Please check your email and follow the attached link to activate two-factor with authenticator app."
         }
@@ -1209,25 +1209,17 @@ class RequestHOTPActivation(flask_restful.Resource):
         msg.attach(
             "scilifelab_logo.png",
             "image/png",
-            open(
-                os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb"
-            ).read(),
+            dds_web.utils.read_email_logo(flask.current_app.static_folder),
             "inline",
             headers=[
                 ["Content-ID", "<Logo>"],
             ],
         )
 
-        msg.body = flask.render_template(
-            f"mail/request_activate_hotp.txt",
-            link=link,
-        )
-        msg.html = flask.render_template(
-            f"mail/request_activate_hotp.html",
-            link=link,
-        )
+        msg.body = dds_web.utils.render_email_template("mail/request_activate_hotp.txt", link=link)
+        msg.html = dds_web.utils.render_email_template("mail/request_activate_hotp.html", link=link)
 
-        dds_web.utils.send_email_with_retry(msg)
+        dds_web.utils.send_email_in_background(msg)
         return {
             "message": "Please check your email and follow the attached link to activate two-factor with email."
         }
@@ -1236,22 +1228,45 @@ class RequestHOTPActivation(flask_restful.Resource):
 class ShowUsage(flask_restful.Resource):
     """Calculate and display the amount of GB hours and the total cost."""
 
-    @auth.login_required(role=["Super Admin", "Unit Admin", "Unit Personnel"])
+    @auth.login_required(role=["Unit Admin", "Unit Personnel"])
     @logging_bind_request
     def get(self):
+        # Only unit accounts can get invoicing information - checked by login_required
         current_user = auth.current_user()
 
-        # Check that user is unit account
-        if current_user.role not in ["Unit Admin", "Unit Personnel"]:
-            raise ddserr.AccessDeniedError(
-                "Access denied - only unit accounts can get invoicing information."
+        # Hours each file version has been stored - until now if not deleted
+        hours_stored = (
+            sqlalchemy.func.timestampdiff(
+                sqlalchemy.literal_column("SECOND"),
+                models.Version.time_uploaded,
+                sqlalchemy.func.coalesce(models.Version.time_deleted, dds_web.utils.current_time()),
             )
+            / 3600.0
+        )
+
+        # Calculate GBHours, as in dds_web.utils.calculate_bytehours
+        gbhours = hours_stored * models.Version.size_stored / 1e9
 
-        # Get unit info from table (incl safespring proj name)
+        # Get the unit's project ids and the GBHours per project
         try:
-            unit_info = models.Unit.query.filter(
-                models.Unit.id == sqlalchemy.func.binary(current_user.unit_id)
-            ).first()
+            unit_project_ids = [
+                public_id
+                for (public_id,) in db.session.query(models.Project.public_id).filter(
+                    models.Project.unit_id == current_user.unit_id
+                )
+            ]
+            gbhours_rows = (
+                db.session.query(models.Project.public_id, sqlalchemy.func.sum(gbhours))
+                .join(models.File, models.File.project_id == models.Project.id)
+                .join(models.Version, models.Version.active_file == models.File.id)
+                .filter(
+                    models.Project.unit_id == current_user.unit_id,
+                    # Empty versions do not contribute to the usage
+                    models.Version.size_stored > 0,
+                )
+                .group_by(models.Project.public_id)
+                .all()
+            )
         except (sqlalchemy.exc.SQLAlchemyError, sqlalchemy.exc.OperationalError) as err:
             flask.current_app.logger.exception(err)
             raise ddserr.DatabaseError(
@@ -1264,46 +1279,22 @@ class ShowUsage(flask_restful.Resource):
                 ),
             ) from err
 
-        # Total number of GB hours and cost saved in the db for the specific unit
-        total_gbhours_db = 0.0
-        total_cost_db = 0.0
-
-        # Project (bucket) specific info
-        usage = {}
-        for p in unit_info.projects:
-            # Define fields in usage dict
-            usage[p.public_id] = {"gbhours": 0.0, "cost": 0.0}
-
-            for f in p.files:
-                for v in f.versions:
-                    # Calculate hours of the current file
-                    time_uploaded = v.time_uploaded
-                    time_deleted = (
-                        v.time_deleted if v.time_deleted else dds_web.utils.current_time()
-                    )
-                    file_hours = (time_deleted - time_uploaded).seconds / (60 * 60)
-
-                    # Calculate GBHours, if statement to avoid zerodivision exception
-                    gb_hours = ((v.size_stored / 1e9) / file_hours) if file_hours else 0.0
+        # Project (bucket) specific info - projects without any file versions should still be listed
+        gbhours_per_project = dict.fromkeys(unit_project_ids, 0.0)
+        for public_id, project_gbhours in gbhours_rows:
+            gbhours_per_project[public_id] = float(project_gbhours or 0.0)
 
-                    # Save file version gbhours to project info and increase total unit sum
-                    usage[p.public_id]["gbhours"] += gb_hours
-                    total_gbhours_db += gb_hours
-
-                    # Calculate approximate cost per gbhour: kr per gb per month / (days * hours)
-                    cost_gbhour = 0.09 / (30 * 24)
-                    cost = gb_hours * cost_gbhour
-
-                    # Save file cost to project info and increase total unit cost
-                    usage[p.public_id]["cost"] += cost
-                    total_cost_db += cost
+        # Total number of GB hours and cost saved in the db for the specific unit
+        total_gbhours_db = sum(gbhours_per_project.values())
+        total_cost_db = total_gbhours_db * dds_web.utils.COST_PER_GBHOUR
 
-            usage[p.public_id].update(
-                {
-                    "gbhours": round(usage[p.public_id]["gbhours"], 2),
-                    "cost": round(usage[p.public_id]["cost"], 2),
-                }
-            )
+        usage = {
+            public_id: {
+                "gbhours": round(gbhours, 2),
+                "cost": round(gbhours * dds_web.utils.COST_PER_GBHOUR, 2),
+            }
+            for public_id, gbhours in gbhours_per_project.items()
+        }
 
         return {
             "total_usage": {
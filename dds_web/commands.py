@@ -1272,50 +1272,65 @@ def monitor_usage():
     dds_contact: str = flask.current_app.config.get("MAIL_DDS")
     default_subject: str = "DDS: Usage quota warning!"
 
+    # Warnings are collected and sent over one mail connection once all units are checked
+    warning_messages: list = []
+
     # Run task
-    for unit in models.Unit.query:
-        flask.current_app.logger.info(f"Checking quotas and usage for: {unit.name}")
+    try:
+        for unit in models.Unit.query:
+            flask.current_app.logger.info(f"Checking quotas and usage for: {unit.name}")
 
-        # Get info from database
-        quota: int = unit.quota
-        warn_after: float = unit.warning_level
-        current_usage: int = unit.size
+            # Get info from database
+            quota: int = unit.quota
+            warn_after: float = unit.warning_level
+            current_usage: int = unit.size
 
-        # Check if 0 and then skip the next steps
-        if not current_usage:
-            flask.current_app.logger.info(
-                f"{unit.name} usage: {current_usage} bytes. Skipping percentage calculation."
-            )
-            continue
-
-        # Calculate percentage of quota
-        perc_used_decimal = current_usage / quota
-        perc_used = round(perc_used_decimal * 100, 3)
+            # Check if 0 and then skip the next steps
+            if not current_usage:
+                flask.current_app.logger.info(
+                    f"{unit.name} usage: {current_usage} bytes. Skipping percentage calculation."
+                )
+                continue
 
-        # Information to log and potentially send
-        info_string: str = (
-            f"- Quota:{quota} bytes\n"
-            f"- Warning level: {int(warn_after*quota)} bytes ({int(warn_after*100)}%)\n"
-            f"- Current usage: {current_usage} bytes ({perc_used}%)\n"
-        )
-        flask.current_app.logger.debug(
-            f"Monitoring the usage for unit '{unit.name}' showed the following:\n" + info_string
-        )
+            # Calculate percentage of quota
+            perc_used_decimal = current_usage / quota
+            perc_used = round(perc_used_decimal * 100, 3)
 
-        # Email if the unit is using more
-        if perc_used_decimal > warn_after:
-            # Email settings
-            unit_contact: str = unit.contact_email
-            message: str = (
-                "Your unit is approaching the allocated data quota (see details below).\n\n"
-                f"NB! If you would like to increase or decrease the allocated quota ('Quota') or the level after which you receive this email ('Warning level'), the technical contact person for your unit must send a request to {dds_contact}.\n"
-                f"Unit name: {unit.name}\n"
-                f"{info_string}"
+            # Information to log and potentially send
+            info_string: str = (
+                f"- Quota:{quota} bytes\n"
+                f"- Warning level: {int(warn_after*quota)} bytes ({int(warn_after*100)}%)\n"
+                f"- Current usage: {current_usage} bytes ({perc_used}%)\n"
             )
-            flask.current_app.logger.info(message)
-            msg: flask_mail.Message = flask_mail.Message(
-                subject=default_subject,
-                recipients=[unit_contact, dds_contact],
-                body=message,
+            flask.current_app.logger.debug(
+                f"Monitoring the usage for unit '{unit.name}' showed the following:\n" + info_string
             )
-            dds_web.utils.send_email_with_retry(msg=msg)
+
+            # Email if the unit is using more
+            if perc_used_decimal > warn_after:
+                # Email settings
+                unit_contact: str = unit.contact_email
+                message: str = (
+                    "Your unit is approaching the allocated data quota (see details below).\n\n"
+                    f"NB! If you would like to increase or decrease the allocated quota ('Quota') or the level after which you receive this email ('Warning level'), the technical contact person for your unit must send a request to {dds_contact}.\n"
+                    f"Unit name: {unit.name}\n"
+                    f"{info_string}"
+                )
+                flask.current_app.logger.info(message)
+                msg: flask_mail.Message = flask_mail.Message(
+                    subject=default_subject,
+                    recipients=[unit_contact, dds_contact],
+                    body=message,
+                )
+                warning_messages.append(msg)
+    except Exception:
+        # Send the warnings collected before the failure, without hiding the failure itself
+        if warning_messages:
+            try:
+                dds_web.utils.send_emails_with_retry(warning_messages)
+            except Exception as err:
+                flask.current_app.logger.exception("Failed to send quota warnings: %s", err)
+        raise
+
+    if warning_messages:
+        dds_web.utils.send_emails_with_retry(warning_messages)
@@ -58,6 +58,8 @@ class Config(object):
     MAIL_USE_SSL = False
     MAIL_DEFAULT_SENDER = ("SciLifeLab DDS", "dds@example.com")
     MAIL_DDS = "delivery@scilifelab.se"
+    # Send invite, project release and self deletion emails without blocking the request
+    MAIL_SEND_IN_BACKGROUND = True
 
     TOKEN_ENDPOINT_ACCESS_LIMIT = "10/hour"
     RATELIMIT_STORAGE_URI = os.environ.get(
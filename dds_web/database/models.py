@@ -275,9 +275,17 @@ class Project(db.Model):
     responsible_unit = db.relationship("Unit", back_populates="projects")
     # ---
     created_by = db.Column(db.String(50), db.ForeignKey("users.username", ondelete="SET NULL"))
-    creator = db.relationship("User", backref="created_projects", foreign_keys=[created_by])
+    creator = db.relationship(
+        "User",
+        backref=db.backref("created_projects", passive_deletes=True),
+        foreign_keys=[created_by],
+    )
     last_updated_by = db.Column(db.String(50), db.ForeignKey("users.username", ondelete="SET NULL"))
-    updator = db.relationship("User", backref="updated_projects", foreign_keys=[last_updated_by])
+    updator = db.relationship(
+        "User",
+        backref=db.backref("updated_projects", passive_deletes=True),
+        foreign_keys=[last_updated_by],
+    )
     # ---
 
     # Additional relationships
@@ -417,9 +425,11 @@ class User(flask_login.UserMixin, db.Model):
     # Delete requests if User is deleted:
     # User has requested self-deletion but is deleted by Admin before confirmation by the e-mail link.
     deletion_request = db.relationship(
-        "DeletionRequest", back_populates="requester", cascade="all, delete"
+        "DeletionRequest", back_populates="requester", passive_deletes=True, cascade="all, delete"
+    )
+    password_reset = db.relationship(
+        "PasswordReset", back_populates="user", passive_deletes=True, cascade="all, delete"
     )
-    password_reset = db.relationship("PasswordReset", back_populates="user", cascade="all, delete")
 
     __mapper_args__ = {"polymorphic_on": type}  # No polymorphic identity --> no create only user
 
@@ -984,7 +994,17 @@ class Version(db.Model):
 
     # Table setup
     __tablename__ = "versions"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Covers the usage calculation so it can be answered from the index alone
+        db.Index(
+            "ix_versions_active_file_usage",
+            "active_file",
+            "size_stored",
+            "time_uploaded",
+            "time_deleted",
+        ),
+        {"extend_existing": True},
+    )
 
     # Columns
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
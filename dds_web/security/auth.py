@@ -13,11 +13,11 @@ import http
 import flask
 import json
 import jwcrypto
-from jwcrypto import jwk, jwt
+from jwcrypto import jwt
 import structlog
 
 # Own modules
-from dds_web import basic_auth, auth, mail
+from dds_web import basic_auth, auth, db, mail
 from dds_web.errors import (
     AuthenticationError,
     AccessDeniedError,
@@ -25,6 +25,7 @@ from dds_web.errors import (
     TokenMissingError,
 )
 from dds_web.database import models
+from dds_web.security.tokens import secret_key_jwk
 import dds_web.utils
 
 action_logger = structlog.getLogger("actions")
@@ -99,13 +100,17 @@ def get_user_roles_common(user):
         request_args = flask.request.args
         project_public_id = request_args.get("project") if request_args else None
         if project_public_id:
-            project = models.Project.query.filter_by(public_id=project_public_id).first()
-            if project:
-                project_user = models.ProjectUsers.query.filter_by(
-                    project_id=project.id, user_id=user.username
-                ).first()
-                if project_user and project_user.owner:
-                    return "Project Owner"
+            is_owner = (
+                db.session.query(models.ProjectUsers.owner)
+                .join(models.Project, models.Project.id == models.ProjectUsers.project_id)
+                .filter(
+                    models.Project.public_id == project_public_id,
+                    models.ProjectUsers.user_id == user.username,
+                )
+                .scalar()
+            )
+            if is_owner:
+                return "Project Owner"
     return user.role
 
 
@@ -366,7 +371,7 @@ def decrypt_token(token):
     Return the signed token embedded inside.
     """
     # Get key used for encryption
-    key = jwk.JWK.from_password(flask.current_app.config.get("SECRET_KEY"))
+    key = secret_key_jwk(flask.current_app.config.get("SECRET_KEY"))
     # Decrypt token
     try:
         decrypted_token = jwt.JWT(key=key, jwt=token, expected_type="JWE")
@@ -383,7 +388,7 @@ def verify_token_signature(token):
     Return the claims such as subject/username on valid signature.
     """
     # Get key used for signing
-    key = jwk.JWK.from_password(flask.current_app.config.get("SECRET_KEY"))
+    key = secret_key_jwk(flask.current_app.config.get("SECRET_KEY"))
 
     # Verify token
     try:
@@ -84,19 +84,23 @@ def __encrypt_project_private_key(owner, project_private_key):
         raise KeyOperationError(message="User public key could not be loaded!") from exc
 
 
-def __decrypt_project_private_key(user, token, encrypted_project_private_key):
+def __load_user_private_key_via_token(user, token):
     private_key_bytes = __decrypt_user_private_key_via_token(user, token)
     if not private_key_bytes:
         raise KeyOperationError(message="User private key could not be decrypted!")
 
     try:
-        user_private_key = serialization.load_der_private_key(private_key_bytes, password=None)
-        if isinstance(user_private_key, asymmetric.rsa.RSAPrivateKey):
-            return __decrypt_with_rsa(encrypted_project_private_key, user_private_key)
+        return serialization.load_der_private_key(private_key_bytes, password=None)
     except ValueError as exc:
         raise KeyOperationError(message="User private key could not be loaded!") from exc
 
 
+def __decrypt_project_private_key(user, token, encrypted_project_private_key):
+    user_private_key = __load_user_private_key_via_token(user, token)
+    if isinstance(user_private_key, asymmetric.rsa.RSAPrivateKey):
+        return __decrypt_with_rsa(encrypted_project_private_key, user_private_key)
+
+
 def obtain_project_private_key(user, project, token):
     project_key = models.ProjectUserKeys.query.filter_by(
         project_id=project.id, user_id=user.username
@@ -109,23 +113,68 @@ def obtain_project_private_key(user, project, token):
 def share_project_private_key(
     from_user, to_another, from_user_token, project, is_project_owner=False
 ):
-    if isinstance(to_another, models.Invite):
-        __init_and_append_project_invite_key(
-            invite=to_another,
-            project=project,
-            project_private_key=obtain_project_private_key(
-                user=from_user, project=project, token=from_user_token
-            ),
-            is_project_owner=is_project_owner,
+    projects_not_shared = share_project_private_keys(
+        from_user=from_user,
+        to_another=to_another,
+        from_user_token=from_user_token,
+        projects=[project],
+        is_project_owner=is_project_owner,
+    )
+    if projects_not_shared:
+        raise KeyNotFoundError(project=project.public_id)
+
+
+def share_project_private_keys(
+    from_user, to_another, from_user_token, projects, is_project_owner=False
+):
+    """Share the private keys of several projects with another user or invite.
+
+    The private key of from_user is decrypted once for all projects, instead of once per project.
+    Return the projects which could not be shared since from_user does not have their keys.
+    """
+    if not projects:
+        return []
+
+    encrypted_project_private_keys = {
+        project_key.project_id: project_key.key
+        for project_key in models.ProjectUserKeys.query.filter(
+            models.ProjectUserKeys.user_id == from_user.username,
+            models.ProjectUserKeys.project_id.in_([project.id for project in projects]),
         )
-    else:
-        __init_and_append_project_user_key(
-            user=to_another,
-            project=project,
-            project_private_key=obtain_project_private_key(
-                user=from_user, project=project, token=from_user_token
-            ),
+    }
+    projects_not_shared = [
+        project for project in projects if project.id not in encrypted_project_private_keys
+    ]
+    if len(projects_not_shared) == len(projects):
+        return projects_not_shared
+
+    user_private_key = __load_user_private_key_via_token(from_user, from_user_token)
+    if not isinstance(user_private_key, asymmetric.rsa.RSAPrivateKey):
+        raise KeyOperationError(message="User private key could not be loaded!")
+
+    for project in projects:
+        if project.id not in encrypted_project_private_keys:
+            continue
+
+        project_private_key = __decrypt_with_rsa(
+            encrypted_project_private_keys[project.id], user_private_key
         )
+        if isinstance(to_another, models.Invite):
+            __init_and_append_project_invite_key(
+                invite=to_another,
+                project=project,
+                project_private_key=project_private_key,
+                is_project_owner=is_project_owner,
+            )
+        else:
+            __init_and_append_project_user_key(
+                user=to_another, project=project, project_private_key=project_private_key
+            )
+
+    del user_private_key
+    gc.collect()
+
+    return projects_not_shared
 
 
 def __init_and_append_project_user_key(user, project, project_private_key):
@@ -4,6 +4,7 @@
 
 # Standard library
 import datetime
+import functools
 import secrets
 
 # Installed
@@ -15,7 +16,23 @@ import dds_web.utils
 import dds_web.forms
 
 
+# VARIABLES ############################################################################ VARIABLES #
+
+# Headers of the signed (JWS) and encrypted (JWE) tokens
+JWS_HEADER = {"alg": "HS256"}
+JWE_PROTECTED_HEADER = {"alg": "A256KW", "enc": "A256GCM"}
+
 # Functions ############################################################################ FUNCTIONS #
+@functools.lru_cache(maxsize=4)
+def secret_key_jwk(secret_key):
+    """
+    Get the symmetric JWK used to sign and encrypt tokens, cached per secret key.
+
+    :param str secret_key: The app secret key, i.e. the SECRET_KEY config variable
+    """
+    return jwk.JWK.from_password(secret_key)
+
+
 def encrypted_jwt_token(
     username,
     sensitive_content,
@@ -34,17 +51,17 @@ def encrypted_jwt_token(
     :param Boolean fully_authenticated: set to True only after successful 2fa which means that all authentication
         steps have succeeded and this final token can be used for normal operation by the cli (default False)
     """
-    jwe_protected_header = {
-        "alg": "A256KW",
-        "enc": "A256GCM",
-    }
+    jwe_protected_header = JWE_PROTECTED_HEADER
     if fully_authenticated:
         # exp claim in this (integrity) protected JWE header is provided only to let the
         # cli know the precise expiration time of the encrypted token. It has no impact
         # on the actual enforcement of the expiration of the token.
         # This time is in iso format in contrast to the actual exp claim in timestamp,
         # because timestamp translates to a wrong time in local date time
-        jwe_protected_header["exp"] = (dds_web.utils.current_time() + expires_in).isoformat()
+        jwe_protected_header = {
+            **JWE_PROTECTED_HEADER,
+            "exp": (dds_web.utils.current_time() + expires_in).isoformat(),
+        }
 
     token = jwt.JWT(
         header=jwe_protected_header,
@@ -56,7 +73,7 @@ def encrypted_jwt_token(
         ),
         expected_type="JWE",
     )
-    key = jwk.JWK.from_password(flask.current_app.config.get("SECRET_KEY"))
+    key = secret_key_jwk(flask.current_app.config.get("SECRET_KEY"))
     token.make_encrypted_token(key)
     return token.serialize()
 
@@ -88,19 +105,21 @@ def __signed_jwt_token(
     :param timedelta expires_in: This is the maximum allowed age of the token. (default 2 days)
     :param Dict or None additional_claims: Any additional token claims can be added. e.g., {"iss": "DDS"}
     """
-    expiration_time = dds_web.utils.current_time() + expires_in
-
     # exp claim has to be in timestamp, otherwise jwcrypto cannot verify the exp claim
     # and so raises an exception for it. This does not cause any timezone issues as it
-    # is only issued and verified on the api side.
-    data = {"sub": username, "exp": expiration_time.timestamp(), "nonce": secrets.token_hex(32)}
+    # is only issued and verified on the api side, with the same current_time convention.
+    # Whole seconds (NumericDate) are enough.
+    expiration_time = int((dds_web.utils.current_time() + expires_in).timestamp())
+
+    # The nonce only makes tokens issued at the same time unique, 128 random bits are enough.
+    data = {"sub": username, "exp": expiration_time, "nonce": secrets.token_urlsafe(16)}
     if additional_claims:
         data.update(additional_claims)
     if sensitive_content:
         data["sen_con"] = sensitive_content
 
-    key = jwk.JWK.from_password(flask.current_app.config.get("SECRET_KEY"))
-    token = jwt.JWT(header={"alg": "HS256"}, claims=data, algs=["HS256"], expected_type="JWS")
+    key = secret_key_jwk(flask.current_app.config.get("SECRET_KEY"))
+    token = jwt.JWT(header=JWS_HEADER, claims=data, algs=["HS256"], expected_type="JWS")
     token.make_signed_token(key)
     return token.serialize()
 
@@ -6,12 +6,14 @@
 
 # Standard library
 import datetime
+import functools
 import os
 import re
 import typing
 import urllib.parse
 import time
 import smtplib
+import threading
 from dateutil.relativedelta import relativedelta
 import gc
 
@@ -29,6 +31,7 @@ from dds_web.errors import (
 )
 import flask_mail
 import flask_login
+import itsdangerous
 import werkzeug
 import sqlalchemy
 
@@ -39,9 +42,16 @@ import wtforms
 
 # Own modules
 from dds_web.database import models
-from dds_web import auth, mail
+from dds_web import auth, db, mail
 from dds_web.version import __version__
 
+####################################################################################################
+# VARIABLES ############################################################################ VARIABLES #
+####################################################################################################
+
+# Approximate storage cost per GB hour: kr per gb per month / (days * hours)
+COST_PER_GBHOUR = 0.09 / (30 * 24)
+
 ####################################################################################################
 # VALIDATORS ########################################################################## VALIDATORS #
 ####################################################################################################
@@ -370,9 +380,42 @@ def get_username_or_request_ip():
 
 def delrequest_exists(email):
     """Check if there is already a deletion request for that email."""
-    if models.DeletionRequest.query.filter_by(email=email).first():
-        return True
-    return False
+    return db.session.query(models.DeletionRequest.query.filter_by(email=email).exists()).scalar()
+
+
+@functools.lru_cache(maxsize=None)
+def read_email_logo(static_folder):
+    """Read the SciLifeLab logo attached to emails.
+
+    The file never changes while the app is running, so it's only read once per static folder.
+    """
+    with open(os.path.join(static_folder, "img/scilifelab_logo.png"), "rb") as logo:
+        return logo.read()
+
+
+@functools.lru_cache(maxsize=2)
+def url_safe_serializer(secret_key):
+    """Get a URL safe timed serializer for the secret key.
+
+    Creating the serializer derives the signing keys from the secret, so reuse one per secret key.
+    """
+    return itsdangerous.URLSafeTimedSerializer(secret_key)
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_template(jinja_env, template_name):
+    """Load an email template once per jinja environment."""
+    return jinja_env.get_template(template_name)
+
+
+def render_email_template(template_name, **context):
+    """Render an email template with the given context.
+
+    Email templates only use the variables passed in and the jinja globals (e.g. url_for),
+    so the compiled template is reused instead of being looked up by flask.render_template
+    and rendered with the full request context for every email.
+    """
+    return get_email_template(flask.current_app.jinja_env, template_name).render(**context)
 
 
 def send_reset_email(email_row, token):
@@ -386,7 +429,7 @@ def send_reset_email(email_row, token):
     msg.attach(
         "scilifelab_logo.png",
         "image/png",
-        open(os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb").read(),
+        read_email_logo(flask.current_app.static_folder),
         "inline",
         headers=[
             ["Content-ID", "<Logo>"],
@@ -394,8 +437,8 @@ def send_reset_email(email_row, token):
     )
 
     link = flask.url_for("auth_blueprint.reset_password", token=token, _external=True)
-    msg.body = flask.render_template("mail/password_reset.txt", link=link)
-    msg.html = flask.render_template("mail/password_reset.html", link=link)
+    msg.body = render_email_template("mail/password_reset.txt", link=link)
+    msg.html = render_email_template("mail/password_reset.html", link=link)
 
     mail.send(msg)
 
@@ -411,15 +454,15 @@ def send_project_access_reset_email(email_row, email, token):
     msg.attach(
         "scilifelab_logo.png",
         "image/png",
-        open(os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb").read(),
+        read_email_logo(flask.current_app.static_folder),
         "inline",
         headers=[
             ["Content-ID", "<Logo>"],
         ],
     )
 
-    msg.body = flask.render_template("mail/project_access_reset.txt", email=email)
-    msg.html = flask.render_template("mail/project_access_reset.html", email=email)
+    msg.body = render_email_template("mail/project_access_reset.txt", email=email)
+    msg.html = render_email_template("mail/project_access_reset.html", email=email)
 
     mail.send(msg)
 
@@ -486,19 +529,81 @@ def page_query(q):
             break
 
 
-def send_email_with_retry(msg, times_retried=0, obj=None):
-    """Send email with retry on exception"""
+def send_email_with_retry(msg, obj=None, retries=2, backoff=5):
+    """Send email, retrying with exponential backoff on SMTP errors.
+
+    :param obj: Object to send the email with, e.g. an open mail connection (default mail)
+    :param int retries: Number of times to retry after the first attempt (default 2)
+    :param int backoff: Seconds to wait before the first retry, doubled for each retry (default 5)
+    """
     if obj is None:
         obj = mail
+
+    for attempt in range(retries + 1):
+        try:
+            obj.send(msg)
+            return
+        except smtplib.SMTPException as err:
+            if attempt == retries:
+                flask.current_app.logger.warning(
+                    "Failed to send email to %s after %s attempts: %s",
+                    msg.recipients,
+                    attempt + 1,
+                    err,
+                )
+                return
+            time.sleep(backoff * 2**attempt)
+
+
+def send_emails_with_retry(msgs):
+    """Send emails with retry, reusing one SMTP connection when there are several.
+
+    A failed connection cannot be retried on, so if the shared connection fails the remaining
+    emails are sent one by one, each with its own connection and retries.
+    """
+    if len(msgs) == 1:
+        send_email_with_retry(msgs[0])
+        return
+
+    num_sent = 0
     try:
-        obj.send(msg)
-    except smtplib.SMTPException as err:
-        # Wait a little bit
-        time.sleep(10)
-        # Retry twice
-        if times_retried < 2:
-            retry = times_retried + 1
-            send_email_with_retry(msg, times_retried=retry, obj=obj)
+        with mail.connect() as conn:
+            for msg in msgs:
+                conn.send(msg)
+                num_sent += 1
+    except OSError as err:  # Includes smtplib.SMTPException and failures to connect
+        flask.current_app.logger.warning(
+            "Shared mail connection failed, sending %s remaining email(s) separately: %s",
+            len(msgs) - num_sent,
+            err,
+        )
+
+    for msg in msgs[num_sent:]:
+        send_email_with_retry(msg)
+
+
+def send_email_in_background(*msgs):
+    """Send emails with retry in a separate thread so that the request does not wait for SMTP.
+
+    The emails are sent directly if MAIL_SEND_IN_BACKGROUND is disabled, e.g. when testing.
+    """
+    if not msgs:
+        return
+
+    app = flask.current_app._get_current_object()
+    if not app.config.get("MAIL_SEND_IN_BACKGROUND"):
+        send_emails_with_retry(msgs)
+        return
+
+    def send_in_app_context():
+        with app.app_context():
+            try:
+                send_emails_with_retry(msgs)
+            except Exception as err:
+                recipients = [recipient for msg in msgs for recipient in msg.recipients]
+                app.logger.exception("Failed to send email to %s: %s", recipients, err)
+
+    threading.Thread(target=send_in_app_context, daemon=True).start()
 
 
 def create_one_time_password_email(user, hotp_value):
@@ -511,16 +616,16 @@ def create_one_time_password_email(user, hotp_value):
     msg.attach(
         "scilifelab_logo.png",
         "image/png",
-        open(os.path.join(flask.current_app.static_folder, "img/scilifelab_logo.png"), "rb").read(),
+        read_email_logo(flask.current_app.static_folder),
         "inline",
         headers=[
             ["Content-ID", "<Logo>"],
         ],
     )
-    msg.body = flask.render_template(
+    msg.body = render_email_template(
         "mail/authenticate.txt", one_time_value=hotp_value.decode("utf-8")
     )
-    msg.html = flask.render_template(
+    msg.html = render_email_template(
         "mail/authenticate.html", one_time_value=hotp_value.decode("utf-8")
     )
 
@@ -888,7 +993,7 @@ def new_file_version(existing_file, new_info):
     # Get versions
     current_file_version = models.Version.query.filter(
         sqlalchemy.and_(
-            models.Version.active_file == sqlalchemy.func.binary(existing_file.id),
+            models.Version.active_file == existing_file.id,
             models.Version.time_deleted.is_(None),
         )
     ).all()
@@ -646,7 +646,7 @@ def change_password():
 @logging_bind_request
 def confirm_self_deletion(token):
     """Confirm user deletion."""
-    s = itsdangerous.URLSafeTimedSerializer(flask.current_app.config.get("SECRET_KEY"))
+    s = dds_web.utils.url_safe_serializer(flask.current_app.config.get("SECRET_KEY"))
 
     try:
         # Get email from token, overwrite the one from login if applicable
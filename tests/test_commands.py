@@ -1449,6 +1449,51 @@ def test_monitor_usage_warning_sent(client, cli_runner, capfd: LogCaptureFixture
                 i += 1
 
 
+# a later unit fails --> warnings for earlier units are still sent
+def test_monitor_usage_warning_sent_if_later_unit_fails(client, cli_runner):
+    """Warnings already collected should be sent even if checking a later unit fails."""
+    units = models.Unit.query.all()
+    for unit in units:
+        unit.quota = 1e14
+        unit.warning_level = 0.8
+    units[-1].quota = 0
+    db.session.commit()
+
+    # Mock the size property of the Unit table
+    with patch("dds_web.database.models.Unit.size", new_callable=PropertyMock) as mock_size:
+        mock_size.return_value = 0.9e14
+
+        with mail.record_messages() as outbox:
+            # Run command
+            result: click.testing.Result = cli_runner.invoke(monitor_usage)
+
+    assert isinstance(result.exception, ZeroDivisionError)
+    assert [msg.recipients[0] for msg in outbox] == [unit.contact_email for unit in units[:-1]]
+
+
+# a later unit fails and the warnings cannot be sent --> the original error is raised
+def test_monitor_usage_send_failure_does_not_hide_error(client, cli_runner):
+    """Failing to send the collected warnings should not replace the error from checking a unit."""
+    units = models.Unit.query.all()
+    for unit in units:
+        unit.quota = 1e14
+        unit.warning_level = 0.8
+    units[-1].quota = 0
+    db.session.commit()
+
+    # Mock the size property of the Unit table
+    with patch("dds_web.database.models.Unit.size", new_callable=PropertyMock) as mock_size:
+        mock_size.return_value = 0.9e14
+
+        with patch("dds_web.utils.send_emails_with_retry") as mock_send:
+            mock_send.side_effect = ConnectionRefusedError("refused")
+            # Run command
+            result: click.testing.Result = cli_runner.invoke(monitor_usage)
+
+    assert isinstance(result.exception, ZeroDivisionError)
+    mock_send.assert_called_once()
+
+
 # set_available_to_expired
 
 
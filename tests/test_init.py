@@ -1,6 +1,7 @@
 import click.testing
+import datetime
 import pytest
-from dds_web import db
+from dds_web import db, OrjsonProvider
 from dds_web.database import models
 from unittest.mock import patch
 from tests import DDSEndpoint, DEFAULT_HEADER, UserAuth, USER_CREDENTIALS
@@ -763,3 +764,27 @@ def test_block_if_maintenance_active_superadmin_ok(client: flask.testing.FlaskCl
         headers=token,
     )
     assert response.status_code == http.HTTPStatus.FORBIDDEN
+
+
+# OrjsonProvider
+
+
+def test_orjson_provider_used_for_json(client: flask.testing.FlaskClient) -> None:
+    """The app should serialize json with the orjson provider, keeping the default format."""
+    assert isinstance(flask.current_app.json, OrjsonProvider)
+
+    # Keys are sorted and non-string keys are allowed
+    assert flask.json.dumps({"b": 1, "a": 2, 3: "c"}) == '{"3":"c","a":2,"b":1}'
+
+    # Datetimes keep the HTTP date format of the default provider
+    assert flask.json.dumps({"date": datetime.datetime(2022, 1, 1)}) == (
+        '{"date":"Sat, 01 Jan 2022 00:00:00 GMT"}'
+    )
+
+    # Custom options are handled by the default provider
+    assert flask.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+    # jsonify returns a json response
+    response = flask.jsonify(a=1)
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"a": 1}
@@ -23,7 +23,9 @@ from dds_web.errors import (
 from dds_web.security.project_user_keys import (
     generate_invite_key_pair,
     generate_user_key_pair,
+    obtain_project_private_key,
     share_project_private_key,
+    share_project_private_keys,
     verify_and_transfer_invite_to_user,
     update_user_keys_for_password_change,
 )
@@ -332,6 +334,99 @@ def test_user_key_not_found_error_for_project(client):
     assert "Unrecoverable key error. Aborting." in str(error.value)
 
 
+def test_share_project_private_keys(client):
+    project_without_keys = models.Project(
+        public_id="random_project_id",
+        title="random project_title",
+        description="This is a random project. ",
+        pi="PI",
+        bucket=f"publicproj-{str(timestamp(ts_format='%Y%m%d%H%M%S'))}-{str(uuid.uuid4())}",
+    )
+
+    invite1 = models.Invite(email="new_unit_user@mailtrap.io", role="Unit Personnel")
+    invite_token1 = encrypted_jwt_token(
+        username="",
+        sensitive_content=generate_invite_key_pair(invite1).hex(),
+        additional_claims={"inv": invite1.email},
+    )
+    unituser = models.User.query.filter_by(username="unituser").first()
+    unituser.unit.projects.append(project_without_keys)
+    unituser.unit.invites.append(invite1)
+    dds_web.db.session.commit()
+    unituser_token = encrypted_jwt_token(
+        username=unituser.username,
+        sensitive_content="password",
+    )
+
+    projects = unituser.unit.projects
+    projects_not_shared = share_project_private_keys(
+        from_user=unituser,
+        to_another=invite1,
+        from_user_token=unituser_token,
+        projects=projects,
+    )
+    dds_web.db.session.commit()
+
+    assert projects_not_shared == [project_without_keys]
+    shared_projects = [project for project in projects if project is not project_without_keys]
+    assert {key.project_id for key in invite1.project_invite_keys} == {
+        project.id for project in shared_projects
+    }
+
+    # The invited user should be able to decrypt the shared keys once registered
+    common_user_fields = {
+        "username": "user_not_existing",
+        "password": "Password123",
+        "name": "Test User",
+    }
+    new_user = models.UnitUser(**common_user_fields)
+    invite1.unit.users.append(new_user)
+    new_user.emails.append(models.Email(email=invite1.email, primary=True))
+    new_user.active = True
+    dds_web.db.session.add(new_user)
+    verify_and_transfer_invite_to_user(invite_token1, new_user, common_user_fields["password"])
+    for project_invite_key in invite1.project_invite_keys:
+        dds_web.db.session.add(
+            models.ProjectUserKeys(
+                project_id=project_invite_key.project_id,
+                user_id=new_user.username,
+                key=project_invite_key.key,
+            )
+        )
+        dds_web.db.session.delete(project_invite_key)
+    dds_web.db.session.delete(invite1)
+    dds_web.db.session.commit()
+
+    new_user_token = encrypted_jwt_token(
+        username=new_user.username,
+        sensitive_content=common_user_fields["password"],
+    )
+    for project in shared_projects:
+        shared_key = obtain_project_private_key(
+            user=new_user, project=project, token=new_user_token
+        )
+        original_key = obtain_project_private_key(
+            user=unituser, project=project, token=unituser_token
+        )
+        assert shared_key == original_key
+
+
+def test_share_project_private_keys_no_projects(client):
+    unituser = models.User.query.filter_by(username="unituser").first()
+    invite1 = models.Invite(email="new_unit_user@mailtrap.io", role="Unit Personnel")
+    unituser_token = encrypted_jwt_token(
+        username=unituser.username,
+        sensitive_content="password",
+    )
+    projects_not_shared = share_project_private_keys(
+        from_user=unituser,
+        to_another=invite1,
+        from_user_token=unituser_token,
+        projects=[],
+    )
+    assert projects_not_shared == []
+
+
 def test_user_key_generation(client):
     user = models.User(username="testuser", password="password")
     assert user.public_key
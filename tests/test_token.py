@@ -7,7 +7,7 @@ from jwcrypto import jwt
 import dds_web.utils
 import tests
 from dds_web.errors import AuthenticationError, TokenMissingError, InviteError
-from dds_web.security.tokens import encrypted_jwt_token, jwt_token
+from dds_web.security.tokens import encrypted_jwt_token, jwt_token, secret_key_jwk
 from dds_web.security.auth import (
     extract_encrypted_token_sensitive_content,
     decrypt_and_verify_token_signature,
@@ -313,3 +313,13 @@ def test_expired_encrypted_token(client):
         verify_token(token)
 
     assert "Expired token" in str(error.value)
+
+
+def test_secret_key_jwk_cached_per_secret(client):
+    """The JWK should only be derived once per secret key."""
+    secret_key = flask.current_app.config.get("SECRET_KEY")
+    assert secret_key_jwk(secret_key) is secret_key_jwk(secret_key)
+
+    other_key = secret_key_jwk("a" * len(secret_key))
+    assert other_key is not secret_key_jwk(secret_key)
+    assert other_key.export_symmetric() != secret_key_jwk(secret_key).export_symmetric()
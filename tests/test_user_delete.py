@@ -337,6 +337,16 @@ def test_del_invite_null_email(client):
     assert response.json.get("email").get("message") == "The email cannot be null."
 
 
+def test_del_user_no_json(client):
+    """Super admin deletes user without specifying any data."""
+    response = client.delete(
+        tests.DDSEndpoint.USER_DELETE,
+        headers=tests.UserAuth(tests.USER_CREDENTIALS["superadmin"]).token(client),
+    )
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+    assert response.json.get("message") == "Required data missing from request!"
+
+
 def test_del_invite_superadmin_as_superadmin(client):
     """Super Admin invites super admin and deletes user."""
     invited_user = {"email": "test_user@mailtrap.io", "role": "Super Admin"}
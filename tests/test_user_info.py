@@ -1,9 +1,14 @@
 # Installed
+import datetime
 import http
 import unittest
+import uuid
 
 # Own
+import dds_web.utils
 import tests
+from dds_web import db
+from dds_web.database import models
 from tests.test_user_delete import user_from_email
 
 
@@ -98,3 +103,61 @@ def test_show_usage_unit_user(client):
     case.assertCountEqual(
         [x.public_id for x in unit_user.projects], response.json["project_usage"].keys()
     )
+
+
+def test_show_usage_gbhours(client):
+    """The GB hours should be the storage time in hours multiplied by the size in GB"""
+    unit_user = models.User.query.filter_by(username="unituser").first()
+
+    # Project with a single 1 TB version stored for 50 hours - longer than a day
+    project = models.Project(
+        public_id="usage_project_id",
+        title="usage project_title",
+        description="This is a project for checking the usage. ",
+        pi="PI",
+        bucket=f"usageproj-{uuid.uuid4()}",
+    )
+    unit_user.unit.projects.append(project)
+    new_file = models.File(
+        name="usage_file",
+        name_in_bucket="usage_file_in_bucket",
+        subpath=".",
+        size_original=10**12,
+        size_stored=10**12,
+        compressed=True,
+        public_key="X" * 64,
+        salt="X" * 32,
+        checksum="X" * 64,
+    )
+    project.files.append(new_file)
+    time_uploaded = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    new_version = models.Version(
+        size_stored=10**12,
+        time_uploaded=time_uploaded,
+        time_deleted=time_uploaded + datetime.timedelta(hours=50),
+    )
+    project.file_versions.append(new_version)
+    new_file.versions.append(new_version)
+    db.session.commit()
+
+    response = client.get(
+        tests.DDSEndpoint.USAGE,
+        headers=tests.UserAuth(tests.USER_CREDENTIALS["unituser"]).token(client),
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.json["project_usage"]["usage_project_id"] == {
+        "gbhours": 1000 * 50,
+        "cost": round(1000 * 50 * dds_web.utils.COST_PER_GBHOUR, 2),
+    }
+
+
+def test_show_usage_superadmin_denied(client):
+    """Super Admins are not connected to a unit and should not be able to get usage info"""
+    response = client.get(
+        tests.DDSEndpoint.USAGE,
+        headers=tests.UserAuth(tests.USER_CREDENTIALS["superadmin"]).token(client),
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+    assert "Insufficient credentials" in response.json["message"]
@@ -1,7 +1,8 @@
 import marshmallow
+import smtplib
 from dds_web import utils
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from unittest.mock import PropertyMock
 
 from dds_web import db
@@ -727,6 +728,51 @@ def test_delrequest_exists_false(client):
     assert not response
 
 
+# read_email_logo
+
+
+def test_read_email_logo(client):
+    """The logo should only be read from disk once."""
+    utils.read_email_logo.cache_clear()
+    static_folder: str = flask.current_app.static_folder
+
+    with open(os.path.join(static_folder, "img/scilifelab_logo.png"), "rb") as logo:
+        logo_bytes: bytes = logo.read()
+
+    assert utils.read_email_logo(static_folder) == logo_bytes
+    assert utils.read_email_logo(static_folder) is utils.read_email_logo(static_folder)
+    assert utils.read_email_logo.cache_info().misses == 1
+
+
+# url_safe_serializer
+
+
+def test_url_safe_serializer(client):
+    """The same serializer should be reused for the same secret key."""
+    secret_key: str = flask.current_app.config["SECRET_KEY"]
+    serializer = utils.url_safe_serializer(secret_key)
+
+    assert utils.url_safe_serializer(secret_key) is serializer
+    assert utils.url_safe_serializer("another_secret") is not serializer
+    assert serializer.loads(serializer.dumps("test@example.com", salt="s"), salt="s") == (
+        "test@example.com"
+    )
+
+
+# render_email_template
+
+
+def test_render_email_template(client):
+    """Email templates should be loaded once and rendered with the given context."""
+    utils.get_email_template.cache_clear()
+
+    rendered: str = utils.render_email_template("mail/password_reset.txt", link="https://link")
+    assert "https://link" in rendered
+
+    utils.render_email_template("mail/password_reset.txt", link="https://link")
+    assert utils.get_email_template.cache_info().misses == 1
+
+
 # send_reset_email
 
 
@@ -918,6 +964,99 @@ def test_page_query(client):
     assert iteration == (len(projects) + previous_projects)
 
 
+# send_email_with_retry
+
+
+def test_send_email_with_retry_backoff(client):
+    """Failed sends should be retried with exponentially increasing waits."""
+    msg = flask_mail.Message("subject", recipients=["test@mailtrap.io"])
+    connection = MagicMock()
+    connection.send.side_effect = smtplib.SMTPException("failed")
+    with patch("dds_web.utils.time.sleep") as mock_sleep:
+        utils.send_email_with_retry(msg, obj=connection)
+    assert connection.send.call_count == 3
+    assert [sleep_call.args[0] for sleep_call in mock_sleep.call_args_list] == [5, 10]
+
+
+def test_send_email_with_retry_success_after_failure(client):
+    """Retrying should stop as soon as the email has been sent."""
+    msg = flask_mail.Message("subject", recipients=["test@mailtrap.io"])
+    connection = MagicMock()
+    connection.send.side_effect = [smtplib.SMTPException("failed"), None]
+    with patch("dds_web.utils.time.sleep") as mock_sleep:
+        utils.send_email_with_retry(msg, obj=connection)
+    assert connection.send.call_count == 2
+    mock_sleep.assert_called_once_with(5)
+
+
+# send_emails_with_retry
+
+
+def test_send_emails_with_retry_shared_connection(client):
+    """Several emails should be sent over one SMTP connection."""
+    msgs = [flask_mail.Message("subject", recipients=[f"test{x}@mailtrap.io"]) for x in range(3)]
+    with patch("dds_web.utils.mail.connect") as mock_connect:
+        with patch("dds_web.utils.send_email_with_retry") as mock_send:
+            utils.send_emails_with_retry(msgs)
+    mock_connect.assert_called_once()
+    conn = mock_connect.return_value.__enter__.return_value
+    assert conn.send.call_args_list == [call(msg) for msg in msgs]
+    mock_send.assert_not_called()
+
+
+def test_send_emails_with_retry_disconnected(client):
+    """Emails not sent when the shared connection drops should be sent separately, with retries."""
+    msgs = [flask_mail.Message("subject", recipients=[f"test{x}@mailtrap.io"]) for x in range(3)]
+    with patch("dds_web.utils.mail.connect") as mock_connect:
+        conn = mock_connect.return_value.__enter__.return_value
+        conn.send.side_effect = [None, smtplib.SMTPServerDisconnected("disconnected")]
+        with patch("dds_web.utils.send_email_with_retry") as mock_send:
+            utils.send_emails_with_retry(msgs)
+    assert conn.send.call_count == 2
+    assert mock_send.call_args_list == [call(msg) for msg in msgs[1:]]
+
+
+def test_send_emails_with_retry_connect_failed(client):
+    """All emails should be sent separately, with retries, if no shared connection can be opened."""
+    msgs = [flask_mail.Message("subject", recipients=[f"test{x}@mailtrap.io"]) for x in range(2)]
+    with patch("dds_web.utils.mail.connect") as mock_connect:
+        mock_connect.return_value.__enter__.side_effect = ConnectionRefusedError("refused")
+        with patch("dds_web.utils.send_email_with_retry") as mock_send:
+            utils.send_emails_with_retry(msgs)
+    assert mock_send.call_args_list == [call(msg) for msg in msgs]
+
+
+# send_email_in_background
+
+
+def test_send_email_in_background_disabled(client):
+    """Emails should be sent within the request when sending in background is disabled."""
+    msg = flask_mail.Message("subject", recipients=["test@mailtrap.io"])
+    with patch("dds_web.utils.send_email_with_retry") as mock_send:
+        with patch("dds_web.utils.threading.Thread") as mock_thread:
+            utils.send_email_in_background(msg)
+    mock_send.assert_called_once_with(msg)
+    mock_thread.assert_not_called()
+
+
+def test_send_email_in_background_enabled(client):
+    """Emails should be sent in a separate thread when sending in background is enabled."""
+    msg = flask_mail.Message("subject", recipients=["test@mailtrap.io"])
+    flask.current_app.config["MAIL_SEND_IN_BACKGROUND"] = True
+    try:
+        with patch("dds_web.utils.send_email_with_retry") as mock_send:
+            with patch("dds_web.utils.threading.Thread") as mock_thread:
+                utils.send_email_in_background(msg)
+                mock_send.assert_not_called()
+                mock_thread.return_value.start.assert_called_once()
+
+                # Run the thread target
+                mock_thread.call_args.kwargs["target"]()
+            mock_send.assert_called_once_with(msg)
+    finally:
+        flask.current_app.config["MAIL_SEND_IN_BACKGROUND"] = False
+
+
 # create_one_time_password_email
 
 
@@ -12,7 +12,6 @@ import unittest.mock
 
 # Installed
 import boto3
-import flask_mail
 import werkzeug
 import sqlalchemy
 
@@ -754,9 +753,9 @@ def test_projectstatus_set_project_to_available_no_mail(module_client, boto3_ses
 
     public_project_id = response.json.get("project_id")
 
-    with unittest.mock.patch.object(flask_mail.Mail, "send") as mock_mail_send:
+    with unittest.mock.patch("dds_web.utils.send_email_in_background") as mock_mail_send:
         with unittest.mock.patch.object(
-            dds_web.api.user.AddUser, "compose_and_send_email_to_user"
+            dds_web.api.user.AddUser, "compose_emails_to_users"
         ) as mock_mail_func:
             response = module_client.post(
                 tests.DDSEndpoint.PROJECT_STATUS,